@@ -0,0 +1,54 @@
+"""
+Shared harness for the standalone check scripts in blockchain/scripts
+
+Each script groups its checks into functions returning a list of booleans
+and hands them to run_checks, which prints the banner and summary:
+    sys.exit(run_checks("Syntheverse Example Test", [check_one, check_two]))
+"""
+
+from typing import Callable, List
+
+
+def check(condition: bool, message: str) -> bool:
+    """
+    Print a check result
+
+    Args:
+        condition: Whether the check passed
+        message: Description of the check
+
+    Returns:
+        The condition, for collecting results
+    """
+    print(("✓ " if condition else "❌ ") + message)
+    return bool(condition)
+
+
+def run_checks(title: str, groups: List[Callable[[], List[bool]]]) -> int:
+    """
+    Run groups of checks under a banner
+
+    Args:
+        title: Banner title
+        groups: Callables each returning a list of check results
+
+    Returns:
+        Process exit code: 0 if every check passed, 1 otherwise
+    """
+    print("=" * 60)
+    print(title)
+    print("=" * 60)
+    print()
+
+    results = []
+    for group in groups:
+        results.extend(group())
+
+    print()
+    print("=" * 60)
+    if not all(results):
+        print(f"❌ {results.count(False)} checks failed")
+        return 1
+    print("All checks passed!")
+    print("=" * 60)
+    return 0
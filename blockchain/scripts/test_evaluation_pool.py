@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Test the multi-process HHF-AI evaluation pool
+
+Uses local stand-in evaluators; no API key or network is needed:
+    python blockchain/scripts/test_evaluation_pool.py
+"""
+
+import sys
+import os
+import tempfile
+import time
+from collections import deque
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "hhf-ai" / "integration"))
+
+from script_checks import check, run_checks
+from evaluation_pool import ContentSpool, EvaluationPool
+from hhf_ai_evaluator import MockHHFAIEvaluator
+
+
+class SleepyEvaluator(MockHHFAIEvaluator):
+    """Mock evaluator that sleeps for content of the form 'sleep:<seconds>'"""
+
+    def evaluate_discovery(self, content, fractal_embedding=None, context=None):
+        if content.startswith("sleep:"):
+            time.sleep(float(content.split(":", 1)[1]))
+        return super().evaluate_discovery(content, fractal_embedding, context)
+
+
+class CrashingEvaluator(MockHHFAIEvaluator):
+    """Mock evaluator whose process exits on its first evaluation while marker_path is absent"""
+
+    def __init__(self, marker_path, always=False):
+        super().__init__()
+        self.marker_path = marker_path
+        self.always = always
+
+    def evaluate_discovery(self, content, fractal_embedding=None, context=None):
+        if self.always:
+            os._exit(1)
+        try:
+            os.close(os.open(self.marker_path, os.O_CREAT | os.O_EXCL))
+            os._exit(1)
+        except FileExistsError:
+            pass
+        return super().evaluate_discovery(content, fractal_embedding, context)
+
+
+def mock_factory():
+    return MockHHFAIEvaluator()
+
+
+def sleepy_factory():
+    return SleepyEvaluator()
+
+
+def crashing_factory(marker_path, always=False):
+    return CrashingEvaluator(marker_path, always)
+
+
+def check_spool():
+    """Identical content is written to the spool once"""
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        spool = ContentSpool(os.path.join(tmp, "content.spool"))
+        first = spool.put("same discovery")
+        other = spool.put("other discovery")
+        again = spool.put("same discovery")
+        spool.close()
+        size = os.path.getsize(spool.path)
+    results.append(check(first == again and len(spool) == 2, "Duplicate content reuses its spool entry"))
+    results.append(check(
+        size == len("same discovery") + len("other discovery"),
+        "Duplicate content is written once"
+    ))
+    return results
+
+
+def check_ordering():
+    """Streaming yields in completion order, evaluate_batch in input order"""
+    results = []
+    expected = MockHHFAIEvaluator()
+
+    with EvaluationPool(processes=1, threads_per_worker=2, evaluator_factory=sleepy_factory,
+                        poll_interval=0.1) as pool:
+        order = [i for i, _ in pool.evaluate_stream(["sleep:0.5", "fast discovery"])]
+        results.append(check(order == [1, 0], f"Stream yields in completion order ({order})"))
+
+    discoveries = ["sleep:0.3", "discovery b", "discovery a", "discovery b", "discovery c"]
+    with EvaluationPool(processes=2, threads_per_worker=2, evaluator_factory=mock_factory,
+                        poll_interval=0.1) as pool:
+        scores = pool.evaluate_batch(discoveries)
+        results.append(check(
+            scores == [expected.evaluate_discovery(d) for d in discoveries],
+            "evaluate_batch returns scores in input order"
+        ))
+    return results
+
+
+def check_spool_reset():
+    """The pool spools duplicates once and starts an empty spool for each stream"""
+    results = []
+    discoveries = ["discovery b", "discovery a", "discovery b", "discovery c"]
+
+    with EvaluationPool(processes=2, evaluator_factory=mock_factory, poll_interval=0.1) as pool:
+        stream = pool.evaluate_stream(discoveries)
+        next(stream)
+        first_path = pool._spool.path
+        results.append(check(len(pool._spool) == 3, "Pool spools duplicate discoveries once"))
+        list(stream)
+        results.append(check(
+            len(pool._spool) == 0 and not os.path.exists(first_path),
+            "Spool is replaced by an empty one after the stream completes"
+        ))
+        results.append(check(
+            pool.evaluate_batch(["discovery d"]) == [MockHHFAIEvaluator().evaluate_discovery("discovery d")],
+            "Workers read from the new spool"
+        ))
+    return results
+
+
+def check_restarts():
+    """A crashed worker rebuilds the pool; repeat offenders fail the job"""
+    results = []
+    expected = MockHHFAIEvaluator()
+    discoveries = ["discovery %d" % i for i in range(8)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        marker = os.path.join(tmp, "crashed")
+        with EvaluationPool(processes=2, evaluator_factory=crashing_factory,
+                            evaluator_kwargs={"marker_path": marker}, poll_interval=0.1) as pool:
+            first_queue = pool._result_queue
+            scores = pool.evaluate_batch(discoveries)
+            results.append(check(
+                scores == [expected.evaluate_discovery(d) for d in discoveries],
+                "All discoveries complete after a worker crash"
+            ))
+            results.append(check(pool.restarts == 1, f"One worker restart is counted ({pool.restarts})"))
+            results.append(check(pool._result_queue is not first_queue, "Result queue is rebuilt after a crash"))
+
+        with EvaluationPool(processes=1, evaluator_factory=crashing_factory,
+                            evaluator_kwargs={"marker_path": marker, "always": True},
+                            max_attempts=2, poll_interval=0.1) as pool:
+            try:
+                pool.evaluate_batch(["doomed discovery"])
+                results.append(check(False, "Job that keeps crashing workers raises RuntimeError"))
+            except RuntimeError:
+                results.append(check(pool.restarts == 1, "Job that keeps crashing workers raises RuntimeError"))
+
+    # Re-queued jobs keep their original order ahead of jobs not yet dispatched
+    with EvaluationPool(processes=2, evaluator_factory=mock_factory, poll_interval=0.1) as pool:
+        pool._workers[0][0].terminate()
+        pool._workers[0][0].join()
+        jobs = {job_id: {"index": job_id, "crashes": 0} for job_id in range(6)}
+        pending = deque([4, 5])
+        pool._restart_dead_workers(jobs, {0: {2, 0}, 1: {3, 1}}, pending)
+        results.append(check(
+            list(pending) == [0, 1, 2, 3, 4, 5],
+            f"Re-dispatched jobs keep their order ({list(pending)})"
+        ))
+    return results
+
+
+def main():
+    return run_checks("Syntheverse Evaluation Pool Test", [check_spool, check_ordering, check_spool_reset, check_restarts])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
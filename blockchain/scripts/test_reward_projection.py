@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Cross-check the off-chain reward projection against the local ProofOfDiscovery contract
+
+Requires a running local node with deployed contracts:
+    npm run compile && npm run node
+    npm run deploy:local
+    python blockchain/scripts/test_reward_projection.py
+"""
+
+import sys
+import os
+import json
+import random
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "hhf-ai" / "integration"))
+
+from web3 import Web3
+from web3.exceptions import ContractLogicError
+from reward_projection import (
+    RewardParameters,
+    project_reward,
+    project_rewards,
+    NUMPY_AVAILABLE,
+)
+
+ARTIFACTS_DIR = Path(__file__).parent.parent / "artifacts"
+DEPLOYMENT_FILE = Path(__file__).parent.parent / "deployments" / "deployment-localhost.json"
+
+# Hand-picked cases: rejections, each epoch boundary, low PoD scores, caps
+FIXED_CASES = [
+    (0, 0, 0),
+    (499, 9000, 9000),
+    (9000, 299, 9000),
+    (9000, 9000, 199),
+    (500, 300, 200),
+    (10000, 10000, 10000),
+    (9000, 8000, 9000),
+    (9000, 7999, 9000),
+    (9000, 6000, 9000),
+    (9000, 5999, 9000),
+    (9000, 4000, 9000),
+    (9000, 3999, 9000),
+    (1200, 8000, 1000),
+    (3000, 8500, 4000),
+    (10000, 300, 10000),
+]
+
+
+def load_abi(contract_name):
+    """Load a contract ABI from Hardhat artifacts"""
+    matches = list(ARTIFACTS_DIR.glob(f"**/{contract_name}.sol/{contract_name}.json"))
+    if not matches:
+        raise FileNotFoundError(f"Artifact for {contract_name} not found. Run 'npm run compile' first")
+    with open(matches[0], 'r') as f:
+        return json.load(f)["abi"]
+
+
+def validate_on_chain(w3, pod, token, account, case_id, scores):
+    """
+    Submit and validate one discovery, returning the observed outcome
+
+    Returns:
+        Dict with validated, reward, distributed and reverts
+    """
+    coherence, density, novelty = scores
+    content_hash = Web3.keccak(text=f"projection-case-{case_id}-{w3.eth.block_number}")
+    fractal_hash = Web3.keccak(text=f"projection-fractal-{case_id}")
+
+    receipt = w3.eth.wait_for_transaction_receipt(
+        pod.functions.submitDiscovery(content_hash, fractal_hash).transact({'from': account})
+    )
+    discovery_id = pod.events.DiscoverySubmitted().process_receipt(receipt)[0]["args"]["discoveryId"]
+
+    balance_before = token.functions.balanceOf(account).call()
+    try:
+        tx_hash = pod.functions.validateDiscovery(discovery_id, coherence, density, novelty).transact({'from': account})
+    except ContractLogicError:
+        return {"validated": False, "reward": 0, "distributed": False, "reverts": True}
+    receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
+
+    validated_events = pod.events.DiscoveryValidated().process_receipt(receipt)
+    minted = token.functions.balanceOf(account).call() - balance_before
+    if not validated_events:
+        return {"validated": False, "reward": 0, "distributed": False, "reverts": False}
+
+    return {
+        "validated": True,
+        "reward": validated_events[0]["args"]["reward"],
+        "distributed": minted > 0,
+        "reverts": False
+    }
+
+
+def compare(case_id, scores, projected, observed):
+    """Compare a projection with the observed on-chain outcome"""
+    expected = {
+        "validated": projected["validated"] and not projected["reverts"],
+        "reward": projected["reward"] if projected["validated"] and not projected["reverts"] else 0,
+        "distributed": projected["distributed"],
+        "reverts": projected["reverts"],
+    }
+    if expected != observed:
+        print(f"❌ Case {case_id} {scores}: projected {expected}, on-chain {observed}")
+        return False
+    return True
+
+
+def main():
+    print("=" * 60)
+    print("Syntheverse Reward Projection Cross-Check")
+    print("=" * 60)
+    print()
+
+    rpc_url = os.getenv("RPC_URL", "http://127.0.0.1:8545")
+    w3 = Web3(Web3.HTTPProvider(rpc_url))
+    if not w3.is_connected():
+        print(f"❌ Error: Cannot connect to {rpc_url}. Start a node with 'npm run node'")
+        return 1
+
+    if not DEPLOYMENT_FILE.exists():
+        print(f"❌ Error: Deployment file not found: {DEPLOYMENT_FILE}")
+        print("Please run 'npm run deploy:local' first")
+        return 1
+
+    with open(DEPLOYMENT_FILE, 'r') as f:
+        deployment = json.load(f)
+    pod_address = deployment['contracts']['ProofOfDiscovery']
+    token_address = deployment['contracts']['SyntheverseToken']
+
+    pod = w3.eth.contract(address=pod_address, abi=load_abi("ProofOfDiscovery"))
+    token = w3.eth.contract(address=token_address, abi=load_abi("SyntheverseToken"))
+    account = deployment['deployer']
+
+    rng = random.Random(1337)
+    cases = FIXED_CASES + [
+        (rng.randint(0, 10000), rng.randint(0, 10000), rng.randint(0, 10000))
+        for _ in range(25)
+    ]
+    failures = 0
+
+    # Isolated: every case validated against the same starting state
+    print("=== Isolated projections ===")
+    params = RewardParameters.from_chain(w3, pod_address, token_address)
+    vectorized = project_rewards(*zip(*cases), params) if NUMPY_AVAILABLE else None
+    for case_id, scores in enumerate(cases):
+        projected = project_reward(*scores, params)
+        if vectorized is not None:
+            if vectorized["reward"][case_id] != projected["reward"] or \
+                    bool(vectorized["reverts"][case_id]) != projected["reverts"] or \
+                    bool(vectorized["distributed"][case_id]) != projected["distributed"]:
+                print(f"❌ Case {case_id} {scores}: vectorized projection differs from scalar")
+                failures += 1
+
+        snapshot = w3.provider.make_request("evm_snapshot", [])["result"]
+        observed = validate_on_chain(w3, pod, token, account, case_id, scores)
+        w3.provider.make_request("evm_revert", [snapshot])
+
+        if not compare(case_id, scores, projected, observed):
+            failures += 1
+    print(f"✓ Checked {len(cases)} isolated cases")
+    print()
+
+    # Sequential: state (epoch, coherence density, distributions) evolves between cases
+    print("=== Sequential projections ===")
+    snapshot = w3.provider.make_request("evm_snapshot", [])["result"]
+    for case_id, scores in enumerate(cases):
+        params = RewardParameters.from_chain(w3, pod_address, token_address)
+        projected = project_reward(*scores, params)
+        observed = validate_on_chain(w3, pod, token, account, 1000 + case_id, scores)
+        if not compare(case_id, scores, projected, observed):
+            failures += 1
+    w3.provider.make_request("evm_revert", [snapshot])
+    print(f"✓ Checked {len(cases)} sequential cases")
+    print()
+
+    print("=" * 60)
+    if failures:
+        print(f"❌ {failures} mismatches")
+        return 1
+    print("Projection matches contract!")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
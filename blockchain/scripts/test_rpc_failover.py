@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Test the resilient RPC provider against local stand-in RPC servers
+
+Starts in-process JSON-RPC servers that behave like healthy, slow, failing
+and unreachable nodes; no blockchain node is needed:
+    python blockchain/scripts/test_rpc_failover.py
+"""
+
+import sys
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "hhf-ai" / "integration"))
+
+from eth_abi import encode
+from web3 import Web3
+from rpc_provider import ResilientHTTPProvider, TransactionSubmissionError
+from blockchain_bridge import SyntheverseBlockchainBridge
+from script_checks import check, run_checks
+
+CHAIN_ID = 1337
+LATEST_BLOCK = 100
+POD_ADDRESS = "0xe7f1725E7734CE288F8367e1Bb143E90bb3F0512"
+DISCOVERER = "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266"
+DISCOVERY_STRUCT = "(bytes32,bytes32,address,uint256,uint256,uint256,uint256,bool,bool)"
+RAW_TX = "0x" + "ab" * 100
+
+
+class StandInNode:
+    """Minimal JSON-RPC node: answers a few methods, optionally slow or failing"""
+
+    def __init__(self, delay: float = 0.0, fail_status: int = None):
+        self.delay = delay
+        self.fail_status = fail_status
+        self.requests = 0
+        self.calls = {}
+        node = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                node.requests += 1
+                time.sleep(node.delay)
+                if node.fail_status:
+                    self.send_response(node.fail_status)
+                    self.end_headers()
+                    return
+                if isinstance(body, list):
+                    payload = [node.answer(request) for request in body]
+                else:
+                    payload = node.answer(body)
+                data = json.dumps(payload).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                try:
+                    self.wfile.write(data)
+                except BrokenPipeError:
+                    # Client already gave up (simulated timeout)
+                    pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def answer(self, request):
+        method, params = request["method"], request.get("params", [])
+        self.calls[method] = self.calls.get(method, 0) + 1
+        if method == "eth_chainId":
+            result = hex(CHAIN_ID)
+        elif method == "eth_blockNumber":
+            result = hex(LATEST_BLOCK)
+        elif method == "eth_getBlockByNumber":
+            number = LATEST_BLOCK - 2 if params[0] == "finalized" else int(params[0], 16)
+            result = {"number": hex(number), "hash": "0x" + f"{number:064x}"}
+        elif method == "eth_getBalance":
+            result = hex(10**18)
+        elif method == "eth_call":
+            # Every call is answered as ProofOfDiscovery.getDiscovery
+            discovery = (b"\x01" * 32, b"\x02" * 32, DISCOVERER, 9000, 8500, 9000, 1700000000, True, False)
+            result = "0x" + encode([DISCOVERY_STRUCT], [discovery]).hex()
+        elif method == "eth_sendRawTransaction":
+            result = Web3.to_hex(Web3.keccak(hexstr=params[0]))
+        elif method == "web3_clientVersion":
+            result = "StandInNode/1.0"
+        else:
+            return {"jsonrpc": "2.0", "id": request["id"], "error": {"code": -32601, "message": "Method not found"}}
+        return {"jsonrpc": "2.0", "id": request["id"], "result": result}
+
+    def close(self):
+        self.server.shutdown()
+
+
+def unused_url():
+    """URL of a port with nothing listening"""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return f"http://127.0.0.1:{s.getsockname()[1]}"
+
+
+def slow_first(provider, slow_url):
+    """Make every endpoint except slow_url a last resort, so slow_url is tried first"""
+    for endpoint in provider.endpoints:
+        if endpoint.url != slow_url:
+            endpoint.healthy = False
+            endpoint.last_failure = time.monotonic()
+
+
+def check_provider():
+    """Failover, weighting, caching, batching and write safety"""
+    fast = StandInNode()
+    slow = StandInNode(delay=0.05)
+    failing = StandInNode(fail_status=503)
+    results = []
+
+    try:
+        # Failover: dead and failing endpoints are skipped
+        provider = ResilientHTTPProvider([unused_url(), failing.url, fast.url], request_timeout=1)
+        w3 = Web3(provider)
+        results.append(check(w3.eth.block_number == LATEST_BLOCK, "Fails over from dead and 503 endpoints"))
+        status = {s["url"]: s for s in provider.endpoint_status()}
+        results.append(check(status[fast.url]["healthy"], "Healthy endpoint stays in rotation"))
+
+        provider.check_health()
+        status = {s["url"]: s for s in provider.endpoint_status()}
+        results.append(check(not status[failing.url]["healthy"], "Health check marks failing endpoint unhealthy"))
+
+        # Latency weighting: the fast node takes most traffic
+        provider = ResilientHTTPProvider([fast.url, slow.url])
+        provider.check_health()
+        fast.requests = slow.requests = 0
+        w3 = Web3(provider)
+        for _ in range(50):
+            w3.eth.get_balance("0x0000000000000000000000000000000000000000")
+        results.append(check(
+            fast.requests > slow.requests,
+            f"Latency-weighted selection prefers fast node ({fast.requests} vs {slow.requests})"
+        ))
+
+        # Caching: chain id and finalized reads are served locally
+        provider = ResilientHTTPProvider([fast.url])
+        w3 = Web3(provider)
+        fast.requests = 0
+        for _ in range(5):
+            w3.eth.chain_id
+        results.append(check(fast.requests == 1, "Chain id is cached"))
+
+        fast.requests = 0
+        for _ in range(5):
+            w3.eth.get_balance("0x0000000000000000000000000000000000000000", block_identifier=LATEST_BLOCK - 5)
+        # One finalized-block lookup plus one balance read
+        results.append(check(fast.requests == 2, "Reads at a finalized block are cached"))
+
+        fast.requests = 0
+        for _ in range(3):
+            w3.eth.get_balance("0x0000000000000000000000000000000000000000", block_identifier=LATEST_BLOCK)
+        results.append(check(fast.requests == 3, "Reads above the finalized block are not cached"))
+
+        # Batching: one HTTP round trip, responses in request order
+        fast.requests = 0
+        responses = provider.make_batch_request([
+            ("eth_blockNumber", []),
+            ("eth_getBalance", ["0x0000000000000000000000000000000000000000", "latest"]),
+            ("eth_chainId", []),
+        ])
+        results.append(check(
+            fast.requests == 1 and responses[0]["result"] == hex(LATEST_BLOCK) and responses[2]["result"] == hex(CHAIN_ID),
+            "Batch request is sent in one round trip, in order"
+        ))
+
+        # Finalized getDiscovery reads through the bridge are served from cache
+        bridge = SyntheverseBlockchainBridge(rpc_url=fast.url, use_real_ai=False)
+        bridge.pod_address = POD_ADDRESS
+        discovery_id = b"\x03" * 32
+        fast.calls = {}
+        bridge.get_discovery(discovery_id)
+        bridge.get_discovery(discovery_id)
+        results.append(check(fast.calls.get("eth_call") == 2, "Default get_discovery reads latest, uncached"))
+
+        fast.calls = {}
+        first = bridge.get_discovery(discovery_id, finalized=True)
+        hits_before = bridge.provider.cache_hits
+        second = bridge.get_discovery(discovery_id, finalized=True)
+        results.append(check(
+            first == second and first[2] == DISCOVERER and first[4] == 8500,
+            "Bridge get_discovery decodes the Discovery struct"
+        ))
+        results.append(check(
+            fast.calls.get("eth_call") == 1 and bridge.provider.cache_hits > hits_before,
+            f"Second finalized get_discovery is a cache hit ({fast.calls.get('eth_call')} eth_call sent)"
+        ))
+
+        # Writes: fail over only when the request never reached a node
+        provider = ResilientHTTPProvider([unused_url(), fast.url], request_timeout=1)
+        provider.endpoints[1].healthy = False
+        provider.endpoints[1].last_failure = time.monotonic()
+        response = provider.make_request("eth_sendRawTransaction", [RAW_TX])
+        results.append(check(
+            response.get("result") == Web3.to_hex(Web3.keccak(hexstr=RAW_TX)),
+            "Transaction send fails over from an unreachable endpoint"
+        ))
+
+        timing_out = StandInNode(delay=0.5)
+        try:
+            provider = ResilientHTTPProvider([timing_out.url, fast.url], request_timeout=0.2)
+            slow_first(provider, timing_out.url)
+            fast.calls = {}
+            try:
+                provider.make_request("eth_sendRawTransaction", [RAW_TX])
+                results.append(check(False, "Timed-out transaction send is not re-sent"))
+            except TransactionSubmissionError as e:
+                results.append(check(
+                    e.tx_hash == Web3.to_hex(Web3.keccak(hexstr=RAW_TX)) and "eth_sendRawTransaction" not in fast.calls,
+                    "Timed-out transaction send is not re-sent and reports its tx hash"
+                ))
+
+            slow_first(provider, timing_out.url)
+            fast.calls = {}
+            try:
+                provider.make_batch_request([("eth_blockNumber", []), ("eth_sendRawTransaction", [RAW_TX])])
+                results.append(check(False, "Timed-out batch with a write is not re-sent"))
+            except TransactionSubmissionError:
+                results.append(check(not fast.calls, "Timed-out batch with a write is not re-sent"))
+
+            slow_first(provider, timing_out.url)
+            results.append(check(
+                provider.make_request("eth_blockNumber", [])["result"] == hex(LATEST_BLOCK),
+                "Timed-out read still fails over"
+            ))
+        finally:
+            timing_out.close()
+
+        # All endpoints down raises ConnectionError
+        provider = ResilientHTTPProvider([unused_url(), failing.url], request_timeout=1)
+        try:
+            provider.make_request("eth_blockNumber", [])
+            results.append(check(False, "All-endpoints-down raises ConnectionError"))
+        except ConnectionError:
+            results.append(check(True, "All-endpoints-down raises ConnectionError"))
+    finally:
+        fast.close()
+        slow.close()
+        failing.close()
+    return results
+
+
+def main():
+    return run_checks("Syntheverse Resilient RPC Provider Test", [check_provider])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
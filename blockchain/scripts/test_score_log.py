@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Test HHF-AI score logging, replay and deterministic evaluation
+
+No API key or network is needed; LLM responses are scripted:
+    python blockchain/scripts/test_score_log.py
+"""
+
+import sys
+import os
+import json
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "hhf-ai" / "integration"))
+
+from script_checks import check, run_checks
+from hhf_ai_evaluator import (
+    HHFAIEvaluator,
+    ReplayHHFAIEvaluator,
+    SYNTHVERSE_SYSTEM_PROMPT,
+    PROMPT_VERSION,
+    PACKED_PROMPT_VERSION,
+    build_evaluation_prompt,
+    compute_packed_item_hash,
+)
+from score_log import ScoreLog, compute_content_hash, compute_prompt_hash
+
+SINGLE_RESPONSE = json.dumps({"coherence": 7100, "density": 6200, "novelty": 5300, "analysis": "single"})
+EMBEDDING = {"depth": 3}
+
+
+def scripted_evaluator(score_log, **kwargs):
+    """Evaluator whose LLM call returns canned JSON"""
+    evaluator = HHFAIEvaluator(api_key="test", score_log=score_log, **kwargs)
+
+    def scripted_complete(evaluation_prompt):
+        if "DISCOVERIES:\n" in evaluation_prompt:
+            return json.dumps({"evaluations": [
+                {"id": "D1", "coherence": 8100, "density": 7200, "novelty": 6300, "analysis": "packed one"},
+                {"id": "D2", "coherence": 8200, "density": 7300, "novelty": 6400, "analysis": "packed two"},
+            ]})
+        return SINGLE_RESPONSE
+
+    evaluator._complete = scripted_complete
+    return evaluator
+
+
+def check_logging_and_replay():
+    """Evaluations are logged with their hashes and replayed from the log"""
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        log = ScoreLog(os.path.join(tmp, "scores.jsonl"))
+        evaluator = scripted_evaluator(log, model="gpt-test", temperature=0.2, seed=7)
+
+        content = "A discovery about recursive interference"
+        scores = evaluator.evaluate_discovery(content, EMBEDDING, "prior work")
+        record = log.lookup(compute_content_hash(content))
+        expected_prompt_hash = compute_prompt_hash(
+            SYNTHVERSE_SYSTEM_PROMPT, build_evaluation_prompt(content, EMBEDDING, "prior work")
+        )
+        results.append(check(
+            record is not None and
+            record["prompt_hash"] == expected_prompt_hash and
+            record["prompt_version"] == PROMPT_VERSION and
+            record["model"] == "gpt-test" and
+            record["temperature"] == 0.2 and record["seed"] == 7 and
+            record["raw_response"] == SINGLE_RESPONSE,
+            "Record holds prompt hash, version, model, temperature, seed and raw response"
+        ))
+
+        packed = ["Packed discovery one", "Packed discovery two"]
+        evaluator.evaluate_pack([("D1", packed[0], None), ("D2", packed[1], EMBEDDING)])
+        packed_record = log.lookup(compute_content_hash(packed[1]))
+        results.append(check(
+            packed_record["prompt_hash"] == compute_packed_item_hash(packed[1], EMBEDDING) and
+            packed_record["prompt_version"] == PACKED_PROMPT_VERSION and
+            json.loads(packed_record["raw_response"])["id"] == "D2",
+            "Packed record is keyed by its own item hash and holds only its own entry"
+        ))
+
+        replay = ReplayHHFAIEvaluator(ScoreLog(log.path))
+        results.append(check(
+            replay.evaluate_discovery(content, EMBEDDING, "prior work") == scores,
+            "Replay serves the logged evaluation"
+        ))
+        results.append(check(
+            replay.evaluate_discovery(packed[1], EMBEDDING)[3] == "packed two",
+            "Replay falls back to packed records"
+        ))
+
+        for args, label in [
+            (("Never evaluated",), "unknown content"),
+            ((content, EMBEDDING, "other context"), "a different context"),
+            ((packed[1], None), "a different fractal embedding"),
+        ]:
+            try:
+                replay.evaluate_discovery(*args)
+                results.append(check(False, f"Replay miss for {label} raises KeyError"))
+            except KeyError:
+                results.append(check(True, f"Replay miss for {label} raises KeyError"))
+    return results
+
+
+def check_deterministic():
+    """Deterministic mode sends temperature 0 and a seed"""
+    results = []
+    requests = []
+
+    def create(**request):
+        requests.append(request)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=SINGLE_RESPONSE))])
+
+    evaluator = HHFAIEvaluator(api_key="test", deterministic=True)
+    evaluator.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    evaluator.evaluate_discovery("Deterministic discovery")
+    results.append(check(
+        requests and requests[0]["temperature"] == 0 and requests[0].get("seed") == 0,
+        "deterministic=True sends temperature 0 and seed"
+    ))
+
+    requests.clear()
+    evaluator = HHFAIEvaluator(api_key="test")
+    evaluator.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    evaluator.evaluate_discovery("Sampled discovery")
+    results.append(check("seed" not in requests[0], "No seed is sent unless one is set"))
+    return results
+
+
+def check_torn_log():
+    """A torn or malformed line is skipped and later appends survive a reload"""
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "scores.jsonl")
+        ScoreLog(path).append("0xa", "0xp", PROMPT_VERSION, "gpt-test", "{}", (1, 2, 3, "a"))
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"prompt_hash": "0xp"}) + "\n")
+            f.write('{"content_hash":"0xb","prompt')
+
+        log = ScoreLog(path)
+        results.append(check(len(log) == 1, "Torn line and record without content_hash are skipped"))
+        log.append("0xc", "0xp", PROMPT_VERSION, "gpt-test", "{}", (4, 5, 6, "c"))
+
+        reloaded = ScoreLog(path)
+        results.append(check(
+            len(reloaded) == 2 and "0xc" in reloaded and "0xb" not in reloaded,
+            "Record appended after a torn line survives a reload"
+        ))
+    return results
+
+
+def main():
+    return run_checks(
+        "Syntheverse Score Log Test",
+        [check_logging_and_replay, check_deterministic, check_torn_log]
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,7 +5,7 @@ Connects HHF-AI validation system to on-chain Proof-of-Discovery protocol
 
 import hashlib
 import json
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Union
 from web3 import Web3
 from eth_account import Account
 import os
@@ -23,24 +23,64 @@ except ImportError:
         HHF_AI_AVAILABLE = False
         print("Warning: HHF-AI evaluator not available. Install dependencies: pip install -r requirements.txt")
 
+try:
+    from .rpc_provider import ResilientHTTPProvider
+except ImportError:
+    from rpc_provider import ResilientHTTPProvider
+
 load_dotenv()
 
+# Minimal ABI for ProofOfDiscovery.getDiscovery, used until full ABIs are loaded
+POD_GET_DISCOVERY_ABI = [
+    {
+        "name": "getDiscovery",
+        "type": "function",
+        "stateMutability": "view",
+        "inputs": [{"name": "discoveryId", "type": "bytes32"}],
+        "outputs": [{
+            "name": "",
+            "type": "tuple",
+            "components": [
+                {"name": "contentHash", "type": "bytes32"},
+                {"name": "fractalHash", "type": "bytes32"},
+                {"name": "discoverer", "type": "address"},
+                {"name": "coherenceScore", "type": "uint256"},
+                {"name": "densityScore", "type": "uint256"},
+                {"name": "noveltyScore", "type": "uint256"},
+                {"name": "timestamp", "type": "uint256"},
+                {"name": "validated", "type": "bool"},
+                {"name": "redundant", "type": "bool"}
+            ]
+        }]
+    }
+]
+
 
 class SyntheverseBlockchainBridge:
     """
     Bridge between Syntheverse HHF-AI and blockchain Proof-of-Discovery protocol
     """
     
-    def __init__(self, rpc_url: str, private_key: Optional[str] = None, use_real_ai: bool = True):
+    def __init__(
+        self,
+        rpc_url: Union[str, List[str]],
+        private_key: Optional[str] = None,
+        use_real_ai: bool = True,
+        finality_depth: Optional[int] = None
+    ):
         """
         Initialize blockchain bridge
         
         Args:
-            rpc_url: Ethereum RPC endpoint (local or testnet)
+            rpc_url: Ethereum RPC endpoint (local or testnet); a list or
+                comma-separated string enables failover across endpoints
             private_key: Private key for signing transactions (optional for read-only)
             use_real_ai: If True, use real HHF-AI evaluator (requires API key)
+            finality_depth: Blocks behind latest treated as final for response
+                caching (default: node's "finalized" tag)
         """
-        self.w3 = Web3(Web3.HTTPProvider(rpc_url))
+        self.provider = ResilientHTTPProvider(rpc_url, finality_depth=finality_depth)
+        self.w3 = Web3(self.provider)
         
         if private_key:
             self.account = Account.from_key(private_key)
@@ -229,6 +269,32 @@ class SyntheverseBlockchainBridge:
         
         return tx_hash.hex()
     
+    def get_discovery(self, discovery_id: str, finalized: bool = False):
+        """
+        Get discovery details from blockchain
+        
+        Args:
+            discovery_id: Discovery ID from blockchain
+            finalized: If True, read at the finalized block so the result is cached.
+                The finalized block can trail the head by minutes, so a recently
+                submitted or validated discovery may read as empty or unvalidated
+            
+        Returns:
+            Discovery struct as returned by ProofOfDiscovery.getDiscovery
+        """
+        pod_contract = self.w3.eth.contract(
+            address=self.pod_address,
+            abi=self.pod_abi or POD_GET_DISCOVERY_ABI
+        )
+        
+        block_identifier = "latest"
+        if finalized:
+            finalized_block = self.provider.finalized_block_number()
+            if finalized_block is not None:
+                block_identifier = finalized_block
+        
+        return pod_contract.functions.getDiscovery(discovery_id).call(block_identifier=block_identifier)
+    
     def get_pending_validations(self, limit: int = 10) -> list:
         """
         Get pending validation requests from blockchain
@@ -0,0 +1,437 @@
+"""
+Syntheverse HHF-AI Evaluation Pool
+Runs HHF-AI evaluators across worker processes, handing out content through a memory-mapped spool
+"""
+
+import mmap
+import multiprocessing
+import os
+import queue
+import shutil
+import tempfile
+import threading
+from collections import deque
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+try:
+    from .hhf_ai_evaluator import get_evaluator
+    from .score_log import compute_content_hash
+except ImportError:
+    from hhf_ai_evaluator import get_evaluator
+    from score_log import compute_content_hash
+
+
+class ContentSpool:
+    """
+    Append-only spool file holding discovery content, addressed by content hash
+
+    The coordinator writes each distinct content once; workers receive only
+    (spool path, content_hash, offset, length) and read the bytes through a
+    shared mmap.
+    """
+
+    def __init__(self, path: str):
+        """
+        Create a content spool
+
+        Args:
+            path: Path to the spool file (truncated if it exists)
+        """
+        self.path = path
+        self._file = open(path, 'wb')
+        self._size = 0
+        self._entries: Dict[str, Tuple[int, int]] = {}
+
+    def put(self, content: str) -> Tuple[str, int, int]:
+        """
+        Spool content, reusing the existing entry for identical content
+
+        Args:
+            content: The discovery content
+
+        Returns:
+            Tuple of (content_hash, offset, length)
+        """
+        content_hash = compute_content_hash(content)
+        entry = self._entries.get(content_hash)
+        if entry is None:
+            data = content.encode('utf-8')
+            self._file.write(data)
+            self._file.flush()
+            entry = (self._size, len(data))
+            self._entries[content_hash] = entry
+            self._size += len(data)
+        return (content_hash,) + entry
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def close(self):
+        """Close the spool file"""
+        self._file.close()
+
+
+class SpoolReader:
+    """Worker-side memory-mapped view of a ContentSpool"""
+
+    def __init__(self, path: str):
+        """
+        Open a spool for reading
+
+        Args:
+            path: Path to the spool file
+        """
+        self.path = path
+        self._file = open(path, 'rb')
+        self._map = None
+        self._lock = threading.Lock()
+
+    def read(self, offset: int, length: int) -> str:
+        """
+        Read spooled content, remapping if the spool has grown
+
+        Args:
+            offset: Byte offset of the content
+            length: Byte length of the content
+
+        Returns:
+            The content string
+        """
+        if length == 0:
+            return ""
+        with self._lock:
+            if self._map is None or offset + length > len(self._map):
+                if self._map is not None:
+                    self._map.close()
+                self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            data = self._map[offset:offset + length]
+        return data.decode('utf-8')
+
+    def close(self):
+        """Unmap and close the spool"""
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            self._file.close()
+
+
+def _worker_main(
+    worker_id: int,
+    job_queue,
+    result_queue,
+    evaluator_factory: Callable,
+    evaluator_kwargs: Dict,
+    threads: int
+):
+    """
+    Worker process entry point
+
+    Builds its own evaluator and runs `threads` job loops so blocking LLM
+    calls overlap within the process. The coordinator starts a new spool file
+    for each stream, so the reader follows the spool path in each job.
+    """
+    evaluator = evaluator_factory(**evaluator_kwargs)
+    spools: Dict[str, SpoolReader] = {}
+    spools_lock = threading.Lock()
+
+    def reader_for(spool_path: str) -> SpoolReader:
+        with spools_lock:
+            if spool_path not in spools:
+                for stale in spools.values():
+                    stale.close()
+                spools.clear()
+                spools[spool_path] = SpoolReader(spool_path)
+            return spools[spool_path]
+
+    def run():
+        while True:
+            job = job_queue.get()
+            if job is None:
+                return
+            job_id, spool_path, content_hash, offset, length, fractal_embedding, context = job
+            try:
+                content = reader_for(spool_path).read(offset, length)
+                scores = evaluator.evaluate_discovery(content, fractal_embedding, context)
+                result_queue.put(("done", worker_id, job_id, scores))
+            except Exception as e:
+                result_queue.put(("error", worker_id, job_id, f"{type(e).__name__}: {e}"))
+
+    runners = [threading.Thread(target=run, daemon=True) for _ in range(threads)]
+    for runner in runners:
+        runner.start()
+    for runner in runners:
+        runner.join()
+
+
+class EvaluationPool:
+    """
+    Multi-process HHF-AI evaluation pool
+
+    The coordinator spools content by hash, dispatches jobs to each worker
+    up to a bounded in-flight window, and yields results in completion order.
+    A dead worker may have died holding the shared result queue's lock, so
+    (as in concurrent.futures) it breaks the result channel: all workers and
+    queues are rebuilt and every in-flight job is re-dispatched.
+
+    Use one thread per worker with all cores for local (mock/heuristic)
+    scoring, and several threads per worker for remote LLM scoring.
+    """
+
+    def __init__(
+        self,
+        processes: Optional[int] = None,
+        threads_per_worker: int = 1,
+        evaluator_factory: Callable = get_evaluator,
+        evaluator_kwargs: Optional[Dict] = None,
+        spool_dir: Optional[str] = None,
+        max_attempts: int = 3,
+        poll_interval: float = 0.5
+    ):
+        """
+        Initialize evaluation pool
+
+        Args:
+            processes: Number of worker processes (default: CPU count)
+            threads_per_worker: Concurrent evaluations per worker process
+            evaluator_factory: Picklable callable returning an evaluator (default: get_evaluator)
+            evaluator_kwargs: Keyword arguments for evaluator_factory
+            spool_dir: Directory for the content spool (default: a temporary directory)
+            max_attempts: Worker crashes a job may be in flight for before it fails
+            poll_interval: Seconds between worker health checks while waiting
+        """
+        self.processes = processes or os.cpu_count() or 1
+        self.threads_per_worker = max(1, threads_per_worker)
+        self.evaluator_factory = evaluator_factory
+        self.evaluator_kwargs = evaluator_kwargs or {}
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+
+        self._owns_spool_dir = spool_dir is None
+        self._spool_dir = spool_dir or tempfile.mkdtemp(prefix="hhf-ai-spool-")
+        self._spool = None
+        self._ctx = multiprocessing.get_context()
+        self._result_queue = None
+        self._workers: Dict[int, Tuple[multiprocessing.Process, object]] = {}
+        self._next_job_id = 0
+        # Jobs dispatched to a live worker whose result has not been received,
+        # including those of an abandoned stream
+        self._in_flight = set()
+        self._spool_generation = 0
+        self.restarts = 0
+
+    def start(self):
+        """Start worker processes"""
+        if self._spool is not None:
+            return
+        os.makedirs(self._spool_dir, exist_ok=True)
+        self._spool = self._new_spool()
+        self._start_workers()
+
+    def _new_spool(self) -> ContentSpool:
+        """Create the next spool file"""
+        self._spool_generation += 1
+        return ContentSpool(os.path.join(self._spool_dir, f"content-{self._spool_generation}.spool"))
+
+    def _reset_spool(self):
+        """Replace the spool with an empty one once no job can still read it"""
+        if self._in_flight or len(self._spool) == 0:
+            return
+        old_path = self._spool.path
+        self._spool.close()
+        self._spool = self._new_spool()
+        try:
+            os.remove(old_path)
+        except OSError:
+            # Still open in a worker on platforms that refuse to unlink open files
+            pass
+
+    def _start_workers(self):
+        """Start all workers with a fresh result queue"""
+        self._result_queue = self._ctx.Queue()
+        for worker_id in range(self.processes):
+            self._start_worker(worker_id)
+
+    def _stop_workers(self):
+        """Terminate all workers and discard their queues without flushing"""
+        for process, job_queue in self._workers.values():
+            if process.is_alive():
+                process.terminate()
+        for process, job_queue in self._workers.values():
+            process.join(timeout=5)
+            # Pending payloads were meant for processes that no longer exist
+            job_queue.cancel_join_thread()
+            job_queue.close()
+        self._workers = {}
+        if self._result_queue is not None:
+            self._result_queue.cancel_join_thread()
+            self._result_queue.close()
+            self._result_queue = None
+
+    def _start_worker(self, worker_id: int):
+        """Start (or restart) a single worker with a fresh job queue"""
+        job_queue = self._ctx.Queue()
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(
+                worker_id,
+                job_queue,
+                self._result_queue,
+                self.evaluator_factory,
+                self.evaluator_kwargs,
+                self.threads_per_worker
+            ),
+            daemon=True
+        )
+        process.start()
+        self._workers[worker_id] = (process, job_queue)
+
+    def close(self):
+        """Stop workers and remove the spool"""
+        if self._spool is None:
+            return
+        for process, job_queue in self._workers.values():
+            if process.is_alive():
+                for _ in range(self.threads_per_worker):
+                    job_queue.put(None)
+        for process, job_queue in self._workers.values():
+            process.join(timeout=5)
+        self._stop_workers()
+        self._spool.close()
+        if self._owns_spool_dir:
+            shutil.rmtree(self._spool_dir, ignore_errors=True)
+        else:
+            os.remove(self._spool.path)
+        self._spool = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def evaluate_stream(
+        self,
+        discoveries: list,
+        fractal_embeddings: Optional[list] = None,
+        context: Optional[str] = None
+    ) -> Iterator[Tuple[int, Tuple[int, int, int, str]]]:
+        """
+        Evaluate discoveries across the pool, yielding results as they complete
+
+        Args:
+            discoveries: List of discovery content strings
+            fractal_embeddings: Optional list of fractal embedding dicts
+            context: Optional context shared by all discoveries
+
+        Yields:
+            (index, (coherence, density, novelty, analysis)) in completion order
+        """
+        self.start()
+
+        jobs = {}
+        pending = deque()
+        for i, content in enumerate(discoveries):
+            embedding = fractal_embeddings[i] if fractal_embeddings and i < len(fractal_embeddings) else None
+            content_hash, offset, length = self._spool.put(content)
+            job_id = self._next_job_id
+            self._next_job_id += 1
+            jobs[job_id] = {
+                "index": i,
+                "payload": (job_id, self._spool.path, content_hash, offset, length, embedding, context),
+                "crashes": 0
+            }
+            pending.append(job_id)
+
+        window = self.threads_per_worker * 2
+        assigned = {worker_id: set() for worker_id in self._workers}
+
+        while jobs:
+            # Dispatch pending jobs up to each worker's in-flight window
+            for worker_id, (process, job_queue) in self._workers.items():
+                while pending and len(assigned[worker_id]) < window:
+                    job_id = pending.popleft()
+                    assigned[worker_id].add(job_id)
+                    self._in_flight.add(job_id)
+                    job_queue.put(jobs[job_id]["payload"])
+
+            try:
+                kind, worker_id, job_id, payload = self._result_queue.get(timeout=self.poll_interval)
+            except queue.Empty:
+                self._restart_dead_workers(jobs, assigned, pending)
+                continue
+
+            assigned[worker_id].discard(job_id)
+            self._in_flight.discard(job_id)
+            job = jobs.pop(job_id, None)
+            if job is None:
+                # Late result for a job already re-dispatched and completed
+                continue
+            if kind == "error":
+                raise RuntimeError(f"HHF-AI evaluation failed for discovery {job['index']}: {payload}")
+            yield (job["index"], payload)
+
+        # Keep the spool from growing across streams of a long-running pool
+        self._reset_spool()
+
+    def _restart_dead_workers(self, jobs: Dict, assigned: Dict, pending: deque):
+        """Rebuild the pool after any worker dies and re-queue all in-flight jobs"""
+        dead = [worker_id for worker_id, (process, _) in self._workers.items() if not process.is_alive()]
+        if not dead:
+            return
+
+        for worker_id in dead:
+            process, _ = self._workers[worker_id]
+            print(f"Warning: HHF-AI worker {worker_id} exited (code {process.exitcode}), restarting pool")
+            for job_id in assigned[worker_id]:
+                job = jobs.get(job_id)
+                if job is None:
+                    continue
+                job["crashes"] += 1
+                if job["crashes"] >= self.max_attempts:
+                    raise RuntimeError(
+                        f"HHF-AI evaluation for discovery {job['index']} crashed {job['crashes']} workers"
+                    )
+
+        # The dead worker may have held the result queue's write lock, leaving
+        # live workers blocked in put(); rebuild every worker and queue
+        requeued = [job_id for worker_jobs in assigned.values() for job_id in worker_jobs if job_id in jobs]
+        pending.extendleft(sorted(requeued, reverse=True))
+        for worker_id in assigned:
+            assigned[worker_id] = set()
+        self._stop_workers()
+        # Nothing dispatched to the old workers can still arrive
+        self._in_flight.clear()
+        self._start_workers()
+        self.restarts += len(dead)
+
+    def evaluate_batch(
+        self,
+        discoveries: list,
+        fractal_embeddings: Optional[list] = None
+    ) -> list:
+        """
+        Evaluate multiple discoveries across the pool
+
+        Args:
+            discoveries: List of discovery content strings
+            fractal_embeddings: Optional list of fractal embedding dicts
+
+        Returns:
+            List of (coherence, density, novelty, analysis) tuples, in input order
+        """
+        results = [None] * len(discoveries)
+        for i, scores in self.evaluate_stream(discoveries, fractal_embeddings):
+            results[i] = scores
+        return results
+
+    def evaluate_discovery(
+        self,
+        content: str,
+        fractal_embedding: Optional[Dict] = None,
+        context: Optional[str] = None
+    ) -> Tuple[int, int, int, str]:
+        """Evaluate a single discovery on the pool"""
+        for _, scores in self.evaluate_stream([content], [fractal_embedding], context):
+            return scores
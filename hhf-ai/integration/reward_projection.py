@@ -0,0 +1,408 @@
+"""
+Syntheverse Reward Projection
+Off-chain mirror of ProofOfDiscovery.validateDiscovery reward math
+
+Reproduces calculatePoDScore, determineEpoch, calculateReward and
+SyntheverseToken.calculateFounderAllocation with the same integer
+arithmetic, so a score can be mapped to its epoch and reward without
+submitting on-chain.
+"""
+
+from typing import Dict, List, Optional
+
+# numpy is only needed for vectorized projections
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# SyntheverseToken constants
+TOTAL_SUPPLY = 90_000_000_000_000 * 10**18
+FOUNDER_EPOCH_HALVING_INTERVAL = 1_000_000
+INITIAL_FOUNDER_REWARD_POOL = TOTAL_SUPPLY * 50 // 100
+MAX_FOUNDER_HALVINGS = 10
+MIN_FOUNDER_REWARD_POOL = TOTAL_SUPPLY // 200
+
+# SyntheverseToken.Epoch
+EPOCH_FOUNDERS = 0
+EPOCH_PIONEER = 1
+EPOCH_PUBLIC = 2
+EPOCH_ECOSYSTEM = 3
+EPOCH_NAMES = ["Founders", "Pioneer", "Public", "Ecosystem"]
+
+MAX_SCORE = 10000
+
+# Minimal ABIs for the public getters read by RewardParameters.from_chain
+POD_STATE_ABI = [
+    {"name": name, "type": "function", "stateMutability": "view", "inputs": [],
+     "outputs": [{"name": "", "type": output_type}]}
+    for name, output_type in [
+        ("token", "address"),
+        ("minCoherenceScore", "uint256"),
+        ("minDensityScore", "uint256"),
+        ("minNoveltyScore", "uint256"),
+        ("foundersDensityThreshold", "uint256"),
+        ("pioneerDensityThreshold", "uint256"),
+        ("publicDensityThreshold", "uint256"),
+        ("minPoDScore", "uint256"),
+        ("maxRewardPercentage", "uint256"),
+        ("totalCoherenceDensity", "uint256"),
+    ]
+]
+
+TOKEN_STATE_ABI = [
+    {"name": name, "type": "function", "stateMutability": "view", "inputs": [],
+     "outputs": [{"name": "", "type": output_type}]}
+    for name, output_type in [
+        ("currentEpoch", "uint8"),
+        ("coherenceDensityThreshold", "uint256"),
+        ("founderAllocation", "uint256"),
+    ]
+] + [
+    {"name": name, "type": "function", "stateMutability": "view",
+     "inputs": [{"name": "", "type": "uint8"}],
+     "outputs": [{"name": "", "type": "uint256"}]}
+    for name in ("epochReserves", "epochDistributed")
+]
+
+
+class RewardParameters:
+    """
+    Snapshot of the ProofOfDiscovery / SyntheverseToken state used by the reward math
+
+    Defaults match freshly deployed contracts.
+    """
+
+    def __init__(
+        self,
+        min_coherence_score: int = 500,
+        min_density_score: int = 300,
+        min_novelty_score: int = 200,
+        founders_density_threshold: int = 8000,
+        pioneer_density_threshold: int = 6000,
+        public_density_threshold: int = 4000,
+        min_pod_score: int = 1000,
+        max_reward_percentage: int = 10000,
+        total_coherence_density: int = 0,
+        current_epoch: int = EPOCH_FOUNDERS,
+        coherence_density_threshold: int = 1000,
+        founder_allocation: int = 0,
+        epoch_reserves: Optional[List[int]] = None,
+        epoch_distributed: Optional[List[int]] = None,
+        block_number: Optional[int] = None
+    ):
+        self.min_coherence_score = min_coherence_score
+        self.min_density_score = min_density_score
+        self.min_novelty_score = min_novelty_score
+        self.founders_density_threshold = founders_density_threshold
+        self.pioneer_density_threshold = pioneer_density_threshold
+        self.public_density_threshold = public_density_threshold
+        self.min_pod_score = min_pod_score
+        self.max_reward_percentage = max_reward_percentage
+        self.total_coherence_density = total_coherence_density
+        self.current_epoch = current_epoch
+        self.coherence_density_threshold = coherence_density_threshold
+        self.founder_allocation = founder_allocation
+        self.epoch_reserves = epoch_reserves or [
+            TOTAL_SUPPLY * 50 // 100,
+            TOTAL_SUPPLY * 10 // 100,
+            TOTAL_SUPPLY * 20 // 100,
+            TOTAL_SUPPLY * 20 // 100,
+        ]
+        self.epoch_distributed = epoch_distributed or [0, 0, 0, 0]
+        self.block_number = block_number
+
+    @classmethod
+    def from_chain(
+        cls,
+        w3,
+        pod_address: str,
+        token_address: Optional[str] = None,
+        block_identifier="latest"
+    ) -> "RewardParameters":
+        """
+        Load parameters from deployed contracts, all read at a single block
+
+        Args:
+            w3: Web3 instance
+            pod_address: ProofOfDiscovery contract address
+            token_address: SyntheverseToken address (default: read from ProofOfDiscovery.token())
+            block_identifier: Block to read state at (default: latest)
+
+        Returns:
+            RewardParameters instance
+        """
+        block_number = w3.eth.get_block(block_identifier)["number"]
+        pod = w3.eth.contract(address=pod_address, abi=POD_STATE_ABI)
+
+        def pod_call(name):
+            return getattr(pod.functions, name)().call(block_identifier=block_number)
+
+        token_address = token_address or pod_call("token")
+        token = w3.eth.contract(address=token_address, abi=TOKEN_STATE_ABI)
+
+        def token_call(name, *args):
+            return getattr(token.functions, name)(*args).call(block_identifier=block_number)
+
+        return cls(
+            min_coherence_score=pod_call("minCoherenceScore"),
+            min_density_score=pod_call("minDensityScore"),
+            min_novelty_score=pod_call("minNoveltyScore"),
+            founders_density_threshold=pod_call("foundersDensityThreshold"),
+            pioneer_density_threshold=pod_call("pioneerDensityThreshold"),
+            public_density_threshold=pod_call("publicDensityThreshold"),
+            min_pod_score=pod_call("minPoDScore"),
+            max_reward_percentage=pod_call("maxRewardPercentage"),
+            total_coherence_density=pod_call("totalCoherenceDensity"),
+            current_epoch=token_call("currentEpoch"),
+            coherence_density_threshold=token_call("coherenceDensityThreshold"),
+            founder_allocation=token_call("founderAllocation"),
+            epoch_reserves=[token_call("epochReserves", epoch) for epoch in range(4)],
+            epoch_distributed=[token_call("epochDistributed", epoch) for epoch in range(4)],
+            block_number=block_number
+        )
+
+    @classmethod
+    def from_bridge(cls, bridge, block_identifier="latest") -> "RewardParameters":
+        """
+        Load parameters using a SyntheverseBlockchainBridge with loaded contracts
+
+        Args:
+            bridge: SyntheverseBlockchainBridge instance
+            block_identifier: Block to read state at (default: latest)
+
+        Returns:
+            RewardParameters instance
+        """
+        return cls.from_chain(bridge.w3, bridge.pod_address, bridge.token_address, block_identifier)
+
+    def to_dict(self) -> Dict:
+        """Serialize parameters to a JSON-compatible dict"""
+        return dict(self.__dict__)
+
+
+def calculate_pod_score(coherence: int, density: int, novelty: int) -> int:
+    """Mirror of ProofOfDiscovery.calculatePoDScore"""
+    return (coherence * density * novelty) // (10000 * 10000)
+
+
+def determine_epoch(density: int, params: RewardParameters) -> int:
+    """Mirror of ProofOfDiscovery.determineEpoch"""
+    if density >= params.founders_density_threshold:
+        return EPOCH_FOUNDERS
+    elif density >= params.pioneer_density_threshold:
+        return EPOCH_PIONEER
+    elif density >= params.public_density_threshold:
+        return EPOCH_PUBLIC
+    else:
+        return EPOCH_ECOSYSTEM
+
+
+def calculate_founder_allocation(coherence_density: int) -> int:
+    """Mirror of SyntheverseToken.calculateFounderAllocation"""
+    if coherence_density < FOUNDER_EPOCH_HALVING_INTERVAL:
+        return INITIAL_FOUNDER_REWARD_POOL
+    halvings = min(coherence_density // FOUNDER_EPOCH_HALVING_INTERVAL, MAX_FOUNDER_HALVINGS)
+    # Repeated integer halving equals a single floor division by 2^n
+    return max(INITIAL_FOUNDER_REWARD_POOL // (2 ** halvings), MIN_FOUNDER_REWARD_POOL)
+
+
+def _available_balance(epoch: int, new_coherence_density: int, params: RewardParameters) -> int:
+    """Available epoch balance as computed in ProofOfDiscovery.calculateReward"""
+    reserve = params.epoch_reserves[epoch]
+    distributed = params.epoch_distributed[epoch]
+    if epoch == EPOCH_FOUNDERS:
+        max_available = reserve if reserve > 0 else calculate_founder_allocation(new_coherence_density)
+        return max_available - distributed if max_available > distributed else 0
+    return reserve - distributed if reserve > distributed else 0
+
+
+def _reward_from_balance(available: int, pod_score: int, params: RewardParameters) -> int:
+    """Reward share of an available balance, as in ProofOfDiscovery.calculateReward"""
+    if available == 0:
+        return 0
+    reward_percentage = min(pod_score, params.max_reward_percentage)
+    return min(available * reward_percentage // 10000, available)
+
+
+def _next_epoch(new_coherence_density: int, params: RewardParameters) -> int:
+    """Token epoch after SyntheverseToken.updateCoherenceDensity"""
+    if new_coherence_density >= params.coherence_density_threshold and params.current_epoch != EPOCH_ECOSYSTEM:
+        return params.current_epoch + 1
+    return params.current_epoch
+
+
+def _founder_allocation_cap(new_coherence_density: int, params: RewardParameters) -> int:
+    """Founders cap checked by SyntheverseToken.distributeTokens when its reserve is zero"""
+    founder_allocation = params.founder_allocation
+    if params.current_epoch == EPOCH_FOUNDERS:
+        founder_allocation = calculate_founder_allocation(new_coherence_density)
+    return founder_allocation if founder_allocation > 0 else TOTAL_SUPPLY
+
+
+def project_reward(
+    coherence: int,
+    density: int,
+    novelty: int,
+    params: Optional[RewardParameters] = None
+) -> Dict:
+    """
+    Project the outcome of validating a discovery with the given scores
+
+    The projection treats the discovery as the next validation against the
+    params snapshot.
+
+    Args:
+        coherence: Coherence score (0-10000)
+        density: Density score (0-10000)
+        novelty: Novelty score (0-10000)
+        params: Contract state snapshot (default: freshly deployed contracts)
+
+    Returns:
+        Dict with validated, pod_score, epoch, reward, distributed and reverts.
+        reward is the value emitted in DiscoveryValidated (in wei); it is only
+        minted when distributed is True. reverts is True when
+        SyntheverseToken.distributeTokens would revert the validation.
+    """
+    params = params or RewardParameters()
+
+    validated = (
+        coherence >= params.min_coherence_score and
+        density >= params.min_density_score and
+        novelty >= params.min_novelty_score
+    )
+    if not validated:
+        return {
+            "validated": False,
+            "pod_score": 0,
+            "epoch": None,
+            "reward": 0,
+            "distributed": False,
+            "reverts": False
+        }
+
+    pod_score = calculate_pod_score(coherence, density, novelty)
+    epoch = determine_epoch(density, params)
+    new_coherence_density = params.total_coherence_density + (coherence * density) // 1000
+    reward = _reward_from_balance(_available_balance(epoch, new_coherence_density, params), pod_score, params)
+
+    distributed = reward > 0 and pod_score >= params.min_pod_score
+    reverts = False
+    if distributed:
+        if epoch != EPOCH_FOUNDERS and epoch != _next_epoch(new_coherence_density, params):
+            reverts = True
+        elif epoch == EPOCH_FOUNDERS and params.epoch_reserves[EPOCH_FOUNDERS] == 0:
+            cap = _founder_allocation_cap(new_coherence_density, params)
+            reverts = params.epoch_distributed[EPOCH_FOUNDERS] + reward > cap
+        else:
+            reverts = params.epoch_distributed[epoch] + reward > params.epoch_reserves[epoch]
+
+    return {
+        "validated": True,
+        "pod_score": pod_score,
+        "epoch": epoch,
+        "reward": reward,
+        "distributed": distributed and not reverts,
+        "reverts": reverts
+    }
+
+
+def project_rewards(coherence, density, novelty, params: Optional[RewardParameters] = None) -> Dict:
+    """
+    Vectorized project_reward over arrays of candidate scores
+
+    Every candidate is projected independently against the same params
+    snapshot. Rewards are exact: they are gathered from per-epoch tables of
+    Python ints indexed by reward percentage, so no float rounding occurs.
+
+    Args:
+        coherence: Array-like of coherence scores (0-10000)
+        density: Array-like of density scores (0-10000)
+        novelty: Array-like of novelty scores (0-10000)
+        params: Contract state snapshot (default: freshly deployed contracts)
+
+    Returns:
+        Dict of numpy arrays: validated, pod_score, epoch (-1 if rejected),
+        reward (object dtype, wei), distributed and reverts
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy not installed. Install with: pip install numpy")
+
+    params = params or RewardParameters()
+
+    coherence = np.asarray(coherence, dtype=np.int64)
+    density = np.asarray(density, dtype=np.int64)
+    novelty = np.asarray(novelty, dtype=np.int64)
+    for scores in (coherence, density, novelty):
+        if scores.size and (scores.min() < 0 or scores.max() > MAX_SCORE):
+            raise ValueError(f"Scores must be in the 0-{MAX_SCORE} range")
+
+    validated = (
+        (coherence >= params.min_coherence_score) &
+        (density >= params.min_density_score) &
+        (novelty >= params.min_novelty_score)
+    )
+
+    pod_score = (coherence * density * novelty) // (10000 * 10000)
+    epoch = np.where(
+        density >= params.founders_density_threshold, EPOCH_FOUNDERS,
+        np.where(
+            density >= params.pioneer_density_threshold, EPOCH_PIONEER,
+            np.where(density >= params.public_density_threshold, EPOCH_PUBLIC, EPOCH_ECOSYSTEM)
+        )
+    )
+    new_coherence_density = params.total_coherence_density + (coherence * density) // 1000
+    reward_percentage = np.minimum(pod_score, params.max_reward_percentage)
+
+    # Table rows 0-3: available balance per epoch. Rows 4+h: Founders pool
+    # after h halvings, only reachable when the Founders reserve is zero.
+    founders_from_pool = params.epoch_reserves[EPOCH_FOUNDERS] == 0
+    halvings = np.minimum(new_coherence_density // FOUNDER_EPOCH_HALVING_INTERVAL, MAX_FOUNDER_HALVINGS)
+    row = epoch.copy()
+    if founders_from_pool:
+        row = np.where(epoch == EPOCH_FOUNDERS, 4 + halvings, epoch)
+
+    balances = [
+        _available_balance(e, params.total_coherence_density, params) for e in range(4)
+    ]
+    if founders_from_pool:
+        distributed_founders = params.epoch_distributed[EPOCH_FOUNDERS]
+        for h in range(MAX_FOUNDER_HALVINGS + 1):
+            pool = calculate_founder_allocation(h * FOUNDER_EPOCH_HALVING_INTERVAL)
+            balances.append(pool - distributed_founders if pool > distributed_founders else 0)
+
+    percentages = range(MAX_SCORE + 1)
+    reward_table = np.empty((len(balances), MAX_SCORE + 1), dtype=object)
+    for i, available in enumerate(balances):
+        reward_table[i] = [_reward_from_balance(available, p, params) for p in percentages]
+    positive_table = reward_table > 0
+
+    reward = reward_table[row, reward_percentage]
+    reward[~validated] = 0
+    distributed = validated & (pod_score >= params.min_pod_score) & positive_table[row, reward_percentage]
+
+    next_epoch = np.where(
+        (new_coherence_density >= params.coherence_density_threshold) &
+        (params.current_epoch != EPOCH_ECOSYSTEM),
+        params.current_epoch + 1,
+        params.current_epoch
+    )
+    reverts = distributed & (epoch != EPOCH_FOUNDERS) & (epoch != next_epoch)
+
+    if founders_from_pool:
+        founders = np.flatnonzero(distributed & (epoch == EPOCH_FOUNDERS))
+        caps = np.array([
+            _founder_allocation_cap(h * FOUNDER_EPOCH_HALVING_INTERVAL, params)
+            for h in range(MAX_FOUNDER_HALVINGS + 1)
+        ], dtype=object)
+        reverts[founders] = (params.epoch_distributed[EPOCH_FOUNDERS] + reward[founders]) > caps[halvings[founders]]
+
+    return {
+        "validated": validated,
+        "pod_score": np.where(validated, pod_score, 0),
+        "epoch": np.where(validated, epoch, -1),
+        "reward": reward,
+        "distributed": distributed & ~reverts,
+        "reverts": reverts
+    }
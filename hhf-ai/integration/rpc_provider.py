@@ -0,0 +1,392 @@
+"""
+Syntheverse Resilient RPC Provider
+Web3 provider with endpoint pooling, health checks, failover, batching and caching of immutable reads
+"""
+
+import json
+import random
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError, MaxRetryError, NewConnectionError
+from web3 import Web3
+from web3.providers import JSONBaseProvider
+
+# Methods whose results never change for a given set of params
+# (receipts are excluded: a reorg can move a transaction to another block)
+IMMUTABLE_METHODS = {
+    "eth_chainId",
+    "net_version",
+    "eth_getBlockByHash",
+}
+
+# Methods whose last param is a block identifier; cacheable at finalized blocks
+BLOCK_SCOPED_METHODS = {
+    "eth_call",
+    "eth_getBalance",
+    "eth_getStorageAt",
+    "eth_getTransactionCount",
+    "eth_getBlockByNumber",
+}
+
+# Methods that must not be re-sent to another node once a node may have received them
+WRITE_METHODS = {
+    "eth_sendRawTransaction",
+    "eth_sendTransaction",
+}
+
+# HTTP status codes treated as node failures (failover) rather than RPC results
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class TransactionSubmissionError(ConnectionError):
+    """
+    A write request failed after it may have reached a node
+
+    The transaction may already be broadcast; check tx_hash (when known)
+    for a receipt before resubmitting.
+    """
+
+    def __init__(self, message: str, tx_hash: Optional[str] = None):
+        super().__init__(message)
+        self.tx_hash = tx_hash
+
+
+def _request_not_sent(error: Exception) -> bool:
+    """Whether a request failed before any bytes reached the node"""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(error, requests.exceptions.ConnectionError) and not isinstance(error, requests.exceptions.ReadTimeout):
+        reason = error.args[0] if error.args else None
+        if isinstance(reason, MaxRetryError):
+            reason = reason.reason
+        return isinstance(reason, (NewConnectionError, ConnectTimeoutError))
+    return False
+
+
+def _write_tx_hashes(requests_list: List[Tuple[str, Any]]) -> List[str]:
+    """Transaction hashes of the raw transactions among write requests"""
+    return [
+        Web3.to_hex(Web3.keccak(hexstr=params[0]))
+        for method, params in requests_list
+        if method == "eth_sendRawTransaction" and params
+    ]
+
+
+class EndpointState:
+    """Health and latency tracking for one RPC endpoint"""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.latency = None         # Exponentially weighted average, seconds
+        self.healthy = True
+        self.consecutive_failures = 0
+        self.last_failure = 0.0
+
+    def record_success(self, latency: float, smoothing: float = 0.3):
+        """Record a successful request and its latency"""
+        self.latency = latency if self.latency is None else (1 - smoothing) * self.latency + smoothing * latency
+        self.healthy = True
+        self.consecutive_failures = 0
+
+    def record_failure(self, max_failures: int):
+        """Record a failed request, marking the endpoint unhealthy after max_failures"""
+        self.consecutive_failures += 1
+        self.last_failure = time.monotonic()
+        if self.consecutive_failures >= max_failures:
+            self.healthy = False
+
+    def to_dict(self) -> Dict:
+        return {
+            "url": self.url,
+            "latency": self.latency,
+            "healthy": self.healthy,
+            "consecutive_failures": self.consecutive_failures
+        }
+
+
+class ResilientHTTPProvider(JSONBaseProvider):
+    """
+    Multi-endpoint JSON-RPC provider for Web3
+
+    Requests go to a latency-weighted choice among healthy endpoints over a
+    pooled keep-alive session, and fail over to the next endpoint on
+    connection errors, timeouts and 429/5xx responses. Transaction sends
+    only fail over when the request never reached the node; otherwise a
+    TransactionSubmissionError carries the tx hash. JSON-RPC error
+    responses (e.g. reverts) are returned as-is. Results of immutable calls
+    (chain id, deployed code, blocks by hash) and of reads pinned to a finalized
+    block number are cached.
+    """
+
+    def __init__(
+        self,
+        endpoint_urls: Union[str, List[str]],
+        request_timeout: float = 10.0,
+        pool_size: int = 10,
+        max_failures: int = 2,
+        retry_interval: float = 30.0,
+        cache_size: int = 4096,
+        finality_depth: Optional[int] = None,
+        finality_ttl: float = 12.0
+    ):
+        """
+        Initialize provider
+
+        Args:
+            endpoint_urls: RPC URL, list of URLs, or comma-separated URLs
+            request_timeout: Per-request timeout in seconds
+            pool_size: Keep-alive connections kept per endpoint
+            max_failures: Consecutive failures before an endpoint is marked unhealthy
+            retry_interval: Seconds before an unhealthy endpoint is tried again
+            cache_size: Maximum number of cached responses
+            finality_depth: Blocks behind latest treated as final. If None, the
+                node's "finalized" block tag is used
+            finality_ttl: Seconds to reuse the looked-up finalized block number
+        """
+        super().__init__()
+        if isinstance(endpoint_urls, str):
+            endpoint_urls = [url.strip() for url in endpoint_urls.split(',') if url.strip()]
+        if not endpoint_urls:
+            raise ValueError("At least one RPC endpoint URL required")
+
+        self.endpoints = [EndpointState(url) for url in endpoint_urls]
+        self.request_timeout = request_timeout
+        self.max_failures = max_failures
+        self.retry_interval = retry_interval
+        self.cache_size = cache_size
+        self.finality_depth = finality_depth
+        self.finality_ttl = finality_ttl
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=len(self.endpoints), pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Content-Type": "application/json"})
+
+        self._cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._finalized_block = None
+        self._finalized_checked = 0.0
+        self.cache_hits = 0
+
+    def __str__(self) -> str:
+        return f"RPC connection {[endpoint.url for endpoint in self.endpoints]}"
+
+    # Endpoint selection and health
+
+    def _candidates(self) -> List[EndpointState]:
+        """Order endpoints for one request: weighted healthy first, then stale unhealthy"""
+        now = time.monotonic()
+        healthy = [e for e in self.endpoints if e.healthy]
+        retryable = [e for e in self.endpoints if not e.healthy and now - e.last_failure >= self.retry_interval]
+        unhealthy = [e for e in self.endpoints if not e.healthy and e not in retryable]
+
+        # Latency-weighted order without replacement; unmeasured endpoints get
+        # the best observed latency so they are tried early
+        known = [e.latency for e in healthy if e.latency is not None]
+        default_latency = min(known) if known else 1.0
+        ordered = []
+        pool = list(healthy)
+        while pool:
+            weights = [1.0 / max(e.latency if e.latency is not None else default_latency, 1e-4) for e in pool]
+            choice = random.choices(pool, weights=weights)[0]
+            ordered.append(choice)
+            pool.remove(choice)
+
+        # Unhealthy endpoints are a last resort, least recently failed first
+        unhealthy.sort(key=lambda e: e.last_failure)
+        return ordered + retryable + unhealthy
+
+    def _post(self, endpoint: EndpointState, body: bytes) -> Any:
+        """POST a JSON-RPC body to one endpoint, raising on node failures"""
+        start = time.monotonic()
+        response = self.session.post(endpoint.url, data=body, timeout=self.request_timeout)
+        if response.status_code in RETRYABLE_STATUS_CODES:
+            raise requests.exceptions.HTTPError(f"HTTP {response.status_code} from {endpoint.url}")
+        response.raise_for_status()
+        decoded = json.loads(response.content)
+        endpoint.record_success(time.monotonic() - start)
+        return decoded
+
+    def _send(self, body: bytes, writes: Optional[List[Tuple[str, Any]]] = None) -> Any:
+        """
+        Send a JSON-RPC body, failing over across endpoints
+
+        Args:
+            body: Encoded JSON-RPC request or batch
+            writes: Write requests contained in body. If any, failover only
+                happens when the request never reached the node; otherwise a
+                TransactionSubmissionError is raised instead of re-sending
+
+        Returns:
+            Decoded JSON-RPC response
+        """
+        errors = []
+        for endpoint in self._candidates():
+            try:
+                return self._post(endpoint, body)
+            except (requests.exceptions.RequestException, ValueError) as e:
+                endpoint.record_failure(self.max_failures)
+                errors.append(f"{endpoint.url}: {e}")
+                if writes and not _request_not_sent(e):
+                    tx_hashes = _write_tx_hashes(writes)
+                    tx_hash = tx_hashes[0] if len(tx_hashes) == 1 else None
+                    raise TransactionSubmissionError(
+                        f"Write request may have reached {endpoint.url} before failing ({e}); "
+                        f"not re-sending. Check receipts for {tx_hashes or 'the submitted transaction'}",
+                        tx_hash=tx_hash
+                    ) from e
+        raise ConnectionError("All RPC endpoints failed: " + "; ".join(errors))
+
+    def check_health(self) -> List[Dict]:
+        """
+        Probe every endpoint with eth_blockNumber
+
+        Returns:
+            List of endpoint status dicts
+        """
+        for endpoint in self.endpoints:
+            try:
+                self._post(endpoint, self.encode_rpc_request("eth_blockNumber", []))
+            except (requests.exceptions.RequestException, ValueError):
+                endpoint.record_failure(1)
+        return [endpoint.to_dict() for endpoint in self.endpoints]
+
+    # Caching
+
+    def finalized_block_number(self) -> Optional[int]:
+        """Latest block number considered final, refreshed every finality_ttl seconds"""
+        now = time.monotonic()
+        if self._finalized_block is not None and now - self._finalized_checked < self.finality_ttl:
+            return self._finalized_block
+
+        if self.finality_depth is not None:
+            response = self._send(self.encode_rpc_request("eth_blockNumber", []))
+            result = response.get("result")
+            number = int(result, 16) - self.finality_depth if result else None
+        else:
+            response = self._send(self.encode_rpc_request("eth_getBlockByNumber", ["finalized", False]))
+            block = response.get("result")
+            number = int(block["number"], 16) if block else None
+
+        self._finalized_block = number
+        self._finalized_checked = now
+        return number
+
+    def _is_cacheable(self, method: str, params: Any) -> bool:
+        """Whether a request's result can be served from cache"""
+        if method in IMMUTABLE_METHODS or method == "eth_getCode":
+            return True
+        if method in BLOCK_SCOPED_METHODS and params:
+            block = params[0] if method == "eth_getBlockByNumber" else params[-1]
+            if not isinstance(block, str) or not block.startswith("0x"):
+                return False
+            finalized = self.finalized_block_number()
+            return finalized is not None and int(block, 16) <= finalized
+        return False
+
+    @staticmethod
+    def _cache_key(method: str, params: Any) -> str:
+        return json.dumps([method, params], sort_keys=True, default=str)
+
+    @staticmethod
+    def _should_store(method: str, response: Dict) -> bool:
+        """Only cache successful, non-empty results"""
+        if "error" in response or response.get("result") is None:
+            return False
+        # Code at an address can still appear later; only cache deployed code
+        return not (method == "eth_getCode" and response["result"] in ("0x", ""))
+
+    def _cache_get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+            return result
+
+    def _cache_put(self, key: str, result: Any):
+        with self._lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def clear_cache(self):
+        """Drop all cached responses"""
+        with self._lock:
+            self._cache.clear()
+
+    # Web3 provider interface
+
+    def make_request(self, method, params: Any) -> Dict:
+        """Send a single JSON-RPC request"""
+        cacheable = self._is_cacheable(method, params)
+        if cacheable:
+            key = self._cache_key(method, params)
+            result = self._cache_get(key)
+            if result is not None:
+                return {"jsonrpc": "2.0", "id": next(self.request_counter), "result": result}
+
+        writes = [(method, params)] if method in WRITE_METHODS else None
+        response = self._send(self.encode_rpc_request(method, params), writes=writes)
+
+        if cacheable and self._should_store(method, response):
+            self._cache_put(key, response["result"])
+        return response
+
+    def make_batch_request(self, requests_list: List[Tuple[str, Any]]) -> List[Dict]:
+        """
+        Send several JSON-RPC requests in one HTTP round trip
+
+        Cached results are served locally; the rest go out as one JSON-RPC
+        batch. Responses are returned in request order.
+
+        Args:
+            requests_list: List of (method, params) tuples
+
+        Returns:
+            List of JSON-RPC response dicts
+        """
+        responses: List[Optional[Dict]] = [None] * len(requests_list)
+        encoded = []
+        pending = {}
+
+        for i, (method, params) in enumerate(requests_list):
+            cacheable = self._is_cacheable(method, params)
+            key = self._cache_key(method, params) if cacheable else None
+            if cacheable:
+                result = self._cache_get(key)
+                if result is not None:
+                    responses[i] = {"jsonrpc": "2.0", "id": next(self.request_counter), "result": result}
+                    continue
+            body = self.encode_rpc_request(method, params)
+            request_id = json.loads(body)["id"]
+            pending[request_id] = (i, method, key)
+            encoded.append(body)
+
+        if encoded:
+            writes = [(method, params) for method, params in requests_list if method in WRITE_METHODS]
+            batch_response = self._send(b"[" + b",".join(encoded) + b"]", writes=writes)
+            if not isinstance(batch_response, list):
+                # Nodes without batch support reply with a single error object
+                raise ValueError(f"RPC batch request rejected: {batch_response}")
+            for response in batch_response:
+                i, method, key = pending[response["id"]]
+                responses[i] = response
+                if key is not None and self._should_store(method, response):
+                    self._cache_put(key, response["result"])
+
+        missing = [i for i, response in enumerate(responses) if response is None]
+        if missing:
+            raise ValueError(f"RPC batch response missing {len(missing)} results")
+        return responses
+
+    def endpoint_status(self) -> List[Dict]:
+        """Get current endpoint health and latency"""
+        return [endpoint.to_dict() for endpoint in self.endpoints]
@@ -0,0 +1,194 @@
+"""
+Syntheverse HHF-AI Score Log
+Append-only JSONL record of HHF-AI evaluations, keyed by content hash
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+def compute_content_hash(content: str) -> str:
+    """
+    Compute the content hash used to key score log records
+
+    Matches SyntheverseBlockchainBridge.compute_content_hash, so a log
+    record can be looked up from an on-chain contentHash.
+
+    Args:
+        content: The discovery content to hash
+
+    Returns:
+        Hex string of content hash
+    """
+    return '0x' + hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def compute_prompt_hash(system_prompt: str, evaluation_prompt: str) -> str:
+    """
+    Compute hash of the exact prompt pair sent to the LLM
+
+    Args:
+        system_prompt: System prompt used for the evaluation
+        evaluation_prompt: User prompt built for the discovery
+
+    Returns:
+        Hex string of prompt hash
+    """
+    hash_obj = hashlib.sha256()
+    hash_obj.update(system_prompt.encode('utf-8'))
+    hash_obj.update(b'\x00')
+    hash_obj.update(evaluation_prompt.encode('utf-8'))
+    return '0x' + hash_obj.hexdigest()
+
+
+class ScoreLog:
+    """
+    Append-only JSONL log of HHF-AI evaluations
+
+    Each line holds one evaluation: content hash, prompt hash, prompt version,
+    model, sampling parameters, raw LLM response and the final scores.
+    Records are never rewritten; a later record for the same content hash
+    takes precedence on lookup.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open (or create) a score log
+
+        Args:
+            path: Path to the JSONL log file
+        """
+        self.path = path
+        self._index: Dict[str, List[Dict]] = {}
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        if os.path.exists(path):
+            self._load()
+
+    def _load(self):
+        """Index existing records by content hash"""
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    record = None
+                if not isinstance(record, dict) or 'content_hash' not in record:
+                    # A torn line from an interrupted write is skipped
+                    print(f"Warning: skipping malformed score log line {line_number} in {self.path}")
+                    continue
+                self._index.setdefault(record['content_hash'], []).append(record)
+
+    def append(
+        self,
+        content_hash: str,
+        prompt_hash: str,
+        prompt_version: str,
+        model: str,
+        raw_response: str,
+        scores: Tuple[int, int, int, str],
+        temperature: Optional[float] = None,
+        seed: Optional[int] = None
+    ) -> Dict:
+        """
+        Append an evaluation record to the log
+
+        Args:
+            content_hash: Hash of the discovery content
+            prompt_hash: Hash of the system + evaluation prompt
+            prompt_version: Version tag of the evaluation prompt
+            model: LLM model that produced the response
+            raw_response: Raw JSON text returned by the LLM
+            scores: Final (coherence, density, novelty, analysis) tuple
+            temperature: Sampling temperature used for the call
+            seed: Sampling seed used for the call, if any
+
+        Returns:
+            The record that was written
+        """
+        coherence, density, novelty, analysis = scores
+        record = {
+            "content_hash": content_hash,
+            "prompt_hash": prompt_hash,
+            "prompt_version": prompt_version,
+            "model": model,
+            "temperature": temperature,
+            "seed": seed,
+            "raw_response": raw_response,
+            "coherence": coherence,
+            "density": density,
+            "novelty": novelty,
+            "analysis": analysis,
+            "timestamp": int(time.time())
+        }
+
+        line = (json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+        with open(self.path, 'a+b') as f:
+            # A writer killed mid-append leaves a torn line without its newline;
+            # terminate it so this record starts on a line of its own
+            f.seek(0, os.SEEK_END)
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    line = b'\n' + line
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+        self._index.setdefault(content_hash, []).append(record)
+        return record
+
+    def lookup(
+        self,
+        content_hash: str,
+        prompt_hash: Optional[str] = None,
+        prompt_version: Optional[str] = None,
+        model: Optional[str] = None
+    ) -> Optional[Dict]:
+        """
+        Find the latest record for a content hash
+
+        Args:
+            content_hash: Hash of the discovery content
+            prompt_hash: If given, only match records for this exact prompt
+            prompt_version: If given, only match records with this prompt version
+            model: If given, only match records produced by this model
+
+        Returns:
+            Matching record, or None if the log has no match
+        """
+        for record in reversed(self._index.get(content_hash, [])):
+            if prompt_hash is not None and record.get('prompt_hash') != prompt_hash:
+                continue
+            if prompt_version is not None and record.get('prompt_version') != prompt_version:
+                continue
+            if model is not None and record.get('model') != model:
+                continue
+            return record
+        return None
+
+    def history(self, content_hash: str) -> List[Dict]:
+        """
+        Get all records for a content hash, oldest first
+
+        Args:
+            content_hash: Hash of the discovery content
+
+        Returns:
+            List of records
+        """
+        return list(self._index.get(content_hash, []))
+
+    def __len__(self) -> int:
+        return sum(len(records) for records in self._index.values())
+
+    def __contains__(self, content_hash: str) -> bool:
+        return content_hash in self._index